@@ -1,9 +1,14 @@
 
 # Requred libraries
-import json
-from typing import Any, Dict, Optional
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class FC26APIError(Exception):
     """Represents an error raised while communicating with the FC 26 API."""
@@ -17,10 +22,20 @@ class FC26_API:
     """
 
     BASE_URL = "https://proclubs.ea.com/api/fc"
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
 
-    def __init__(self, session: Optional[requests.Session] = None, timeout: int = 10) -> None:
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: int = 10,
+        details_ttl: float = 3600.0,
+        matches_ttl: float = 15.0,
+    ) -> None:
+        self.session = session or self._build_session()
         self.timeout = timeout
+        self.details_ttl = details_ttl
+        self.matches_ttl = matches_ttl
         self.headers: Dict[str, str] = {
             "authority": "proclubs.ea.com",
             "accept-language": "en-US,en;q=0.9",
@@ -29,8 +44,30 @@ class FC26_API:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36"
             ),
+            "connection": "keep-alive",
         }
         self._last_error: Optional[FC26APIError] = None
+        # (url, params, orient) -> (ETag, parsed response)
+        self._etag_cache: Dict[Tuple[str, FrozenSet[Tuple[str, Any]], Optional[str]], Tuple[str, pd.DataFrame]] = {}
+        # Result caches: key -> (expiry on time.monotonic(), DataFrame)
+        self._details_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        self._matches_cache: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """Create a session with a pooled keep-alive adapter and retries for transient failures."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
 
     def _build_url(self, endpoint: str) -> str:
         """Return the full URL for either a relative endpoint or absolute URL."""
@@ -42,6 +79,7 @@ class FC26_API:
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
+        orient: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Builds and sends a request to the EA Sports FC 26 Pro Clubs API.
@@ -49,45 +87,97 @@ class FC26_API:
         Args:
             endpoint: The endpoint or absolute URL to send the request to.
             params: The parameters to include in the request.
+            orient: Passed to pd.DataFrame.from_dict when set; "index" makes each
+                top-level key of a dict payload a row.
 
         Returns:
             A pandas DataFrame containing the response from the API.
+
+        Responses carrying an ETag are cached until a non-304 reply replaces them; the
+        next request is made conditional and a 304 reuses the cached frame.
         """
         url = self._build_url(endpoint)
+        cache_key = (url, frozenset((params or {}).items()), orient)
+        cached = self._etag_cache.get(cache_key)
+
+        headers = self.headers
+        if cached is not None:
+            headers = {**self.headers, "If-None-Match": cached[0]}
+
         try:
             response = self.session.get(
                 url,
                 params=params,
-                headers=self.headers,
+                headers=headers,
                 timeout=self.timeout,
             )
             response.raise_for_status()
         except requests.RequestException as exc:
             raise FC26APIError(f"Request to {url} failed") from exc
 
+        if cached is not None and response.status_code == 304:
+            return cached[1].copy()
+
         try:
-            payload = response.json()
-        except json.JSONDecodeError as exc:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             raise FC26APIError(f"Failed to decode JSON from {url}") from exc
 
         if payload is None:
-            return pd.DataFrame()
+            df = pd.DataFrame()
+        elif orient is not None:
+            df = pd.DataFrame.from_dict(payload, orient=orient)
+        else:
+            df = pd.DataFrame(payload)
 
-        return pd.DataFrame(payload)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, df.copy())
+        else:
+            self._etag_cache.pop(cache_key, None)
+        return df
     
-    def _handle_api_call(self, endpoint: str, params: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    def _handle_api_call(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        orient: Optional[str] = None,
+    ) -> Optional[pd.DataFrame]:
         """Execute an API call and convert structured errors into None responses."""
         try:
-            df = self._request_builder(endpoint, params=params)
+            df = self._request_builder(endpoint, params=params, orient=orient)
             self._last_error = None
             return df
         except FC26APIError as exc:
             self._last_error = exc
             return None
 
+    def _cache_get(self, cache: Dict[Any, Tuple[float, pd.DataFrame]], key: Any) -> Optional[pd.DataFrame]:
+        """Return a copy of a cached DataFrame if its entry has not expired."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expiry, df = entry
+        if time.monotonic() >= expiry:
+            del cache[key]
+            return None
+        return df.copy()
+
+    def _cache_put(
+        self,
+        cache: Dict[Any, Tuple[float, pd.DataFrame]],
+        key: Any,
+        df: pd.DataFrame,
+        ttl: float,
+    ) -> None:
+        """Store a copy of a DataFrame for ``ttl`` seconds."""
+        if ttl > 0:
+            cache[key] = (time.monotonic() + ttl, df.copy())
+
     def _timestamp_to_datetime(self, timestamp: pd.Series, offset_hours: int = 0) -> pd.Series:
-        """Convert POSIX timestamps (seconds) into timezone-adjusted datetimes."""
-        return pd.to_datetime(timestamp, unit="s") + pd.Timedelta(hours=offset_hours)
+        """Convert POSIX timestamps (seconds) into datetimes aware of a fixed UTC offset."""
+        tz = datetime.timezone(datetime.timedelta(hours=offset_hours))
+        return pd.to_datetime(timestamp, unit="s", utc=True).dt.tz_convert(tz)
 
     def _apply_timestamp_column(
         self,
@@ -95,15 +185,62 @@ class FC26_API:
         column_name: str,
         offset_hours: int,
     ) -> pd.DataFrame:
-        """Apply timestamp conversion only when the target column exists."""
+        """
+        Apply timestamp conversion only when the target column exists.
+
+        The column is converted in place; callers pass frames they own
+        (fresh from _request_builder or copies out of the caches).
+        """
         if df.empty:
             return df
         if column_name not in df.columns:
             raise FC26APIError(f"Column '{column_name}' not found for timestamp conversion.")
-        df = df.copy()
         df[column_name] = self._timestamp_to_datetime(df[column_name], offset_hours=offset_hours)
         return df
 
+    def _serialize_nested_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Encode dict/list cells as JSON strings so flat file formats can round-trip them."""
+        nested_columns = [
+            column
+            for column in df.columns
+            if df[column].dtype == object and df[column].map(lambda value: isinstance(value, (list, dict))).any()
+        ]
+        if not nested_columns:
+            return df
+        return df.assign(
+            **{
+                column: df[column].map(
+                    lambda value: orjson.dumps(value).decode() if isinstance(value, (list, dict)) else value
+                )
+                for column in nested_columns
+            }
+        )
+
+    @staticmethod
+    def _flatten_record(
+        record: Any,
+        prefix: str,
+        sep: str = ".",
+        flat: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Flatten nested dicts into a single level, mirroring pd.json_normalize column names.
+
+        Nested keys are joined with ``sep`` and the top level is prefixed without a
+        separator, matching ``pd.json_normalize(...).add_prefix(prefix)``. Lists are kept as values.
+        """
+        if flat is None:
+            flat = {}
+        if not isinstance(record, dict):
+            return flat
+        for key, value in record.items():
+            column = f"{prefix}{key}"
+            if isinstance(value, dict):
+                FC26_API._flatten_record(value, f"{column}{sep}", sep, flat)
+            else:
+                flat[column] = value
+        return flat
+
     def _normalizer(self, df: Optional[pd.DataFrame], prefix: str) -> Optional[pd.DataFrame]:
         if df is None:
             return None
@@ -112,8 +249,9 @@ class FC26_API:
         if prefix not in df.columns:
             raise FC26APIError(f"Expected nested column '{prefix}' missing from response.")
 
-        nested_series = df[prefix].apply(lambda value: value if isinstance(value, (list, dict)) else {})
-        normalized_df = pd.json_normalize(nested_series).add_prefix(prefix)
+        # _flatten_record returns an empty row for anything that is not a dict
+        flat_rows = [self._flatten_record(record, prefix) for record in df[prefix].tolist()]
+        normalized_df = pd.DataFrame(flat_rows, index=df.index)
         final_df = pd.concat([df.drop(columns=[prefix]), normalized_df], axis=1)
         return final_df
     
@@ -126,19 +264,33 @@ class FC26_API:
 
         Returns:
             A pandas DataFrame containing the club's details, or None if the request fails.
+            Results are cached per club for ``details_ttl`` seconds.
         """
+        cached = self._cache_get(self._details_cache, club_id)
+        if cached is not None:
+            return cached
+
         params = {"platform": "common-gen5", "clubIds": club_id}
-        club_details = self._handle_api_call("clubs/info", params=params)
+        # One row per club, built directly instead of transposing a column-per-club frame
+        club_details = self._handle_api_call("clubs/info", params=params, orient="index")
         if club_details is None:
             return None
-        return club_details.T
+        self._cache_put(self._details_cache, club_id, club_details, self.details_ttl)
+        return club_details
     
     def get_club_matches(self, club_id: str, match_type: str = "leagueMatch") -> Optional[pd.DataFrame]:
         """
         Retrieve club matches for the provided match type.
 
         match_type: friendlyMatch, leagueMatch, playoffMatch
+
+        Results are cached per (club_id, match_type) for ``matches_ttl`` seconds.
         """
+        cache_key = (club_id, match_type)
+        cached = self._cache_get(self._matches_cache, cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             "platform": "common-gen5",
             "clubIds": club_id,
@@ -150,10 +302,12 @@ class FC26_API:
             return matches
 
         try:
-            return self._apply_timestamp_column(matches, "timestamp", offset_hours=2)
+            matches = self._apply_timestamp_column(matches, "timestamp", offset_hours=2)
         except FC26APIError as exc:
             self._last_error = exc
             return None
+        self._cache_put(self._matches_cache, cache_key, matches, self.matches_ttl)
+        return matches
         
     def get_club_matches_normalized(
         self,
@@ -183,6 +337,33 @@ class FC26_API:
             self._last_error = exc
             return None
 
+    def get_many_club_matches_normalized(
+        self,
+        club_ids: Iterable[str],
+        match_type: str = "friendlyMatch",
+        gmt: int = 2,
+        max_workers: int = 8,
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Retrieve normalized matches for several clubs concurrently.
+
+        Requests are issued from a small thread pool over the shared session, so
+        they reuse its pooled connections instead of running one after another.
+        With concurrent calls, _last_error only reflects the most recent failure.
+
+        Returns:
+            A dict mapping each club ID to its normalized matches (or None on failure).
+        """
+        club_ids = list(dict.fromkeys(club_ids))
+        if not club_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(club_ids))) as executor:
+            results = executor.map(
+                lambda club_id: self.get_club_matches_normalized(club_id, match_type=match_type, gmt=gmt),
+                club_ids,
+            )
+            return dict(zip(club_ids, results))
 
     def export_dataframe(
         self,
@@ -208,7 +389,7 @@ class FC26_API:
         try:
             file_format = file_format.lower()
             if file_format == "csv":
-                df.to_csv(filepath, index=False)
+                self._serialize_nested_columns(df).to_csv(filepath, index=False)
                 print(f"✓ Data exported to CSV: {filepath}")
             elif file_format == "excel":
                 df.to_excel(filepath, index=False)
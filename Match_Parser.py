@@ -1,12 +1,87 @@
 
 # Required libraries
-import json
+import csv
+import functools
+import io
+import mmap
+import operator
+import os
+import sys
+import orjson
 import pandas as pd
 import ast
+from concurrent.futures import ProcessPoolExecutor
+from API_Service import FC26APIError
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
 
-@dataclass
+# club_matches.csv columns read by MatchPlayerParser, in _parse_match_row argument order
+_MATCH_CSV_COLUMNS = ('matchId', 'timestamp', 'timeAgo', 'players')
+
+# Match CSVs larger than this are parsed across worker processes
+_PARALLEL_PARSE_THRESHOLD = 16 * 1024 * 1024
+
+# Column order of most_recent_matches.csv
+_MOST_RECENT_COLUMNS = (
+    'matchId', 'timestamp', 'timeAgo', 'club_id', 'player_id', 'player_name',
+    'position', 'rating', 'goals', 'assists', 'shots', 'passes', 'pass_attempts',
+    'tackles', 'tackle_attempts', 'saves', 'seconds_played', 'score', 'redcards',
+)
+# PlayerStats attributes for the per-player part of a most_recent_matches.csv row
+_player_row = operator.attrgetter(*_MOST_RECENT_COLUMNS[3:])
+
+# PlayerStats attribute, API key, caster and default for each per-player stat
+_PLAYER_SCHEMA = (
+    ('player_name', 'playername', str, 'Unknown'),
+    ('position', 'pos', str, 'Unknown'),
+    ('archetype_id', 'archetypeid', str, '0'),
+    ('rating', 'rating', float, 0),
+    ('goals', 'goals', int, 0),
+    ('assists', 'assists', int, 0),
+    ('shots', 'shots', int, 0),
+    ('passes', 'passesmade', int, 0),
+    ('pass_attempts', 'passattempts', int, 0),
+    ('tackles', 'tacklesmade', int, 0),
+    ('tackle_attempts', 'tackleattempts', int, 0),
+    ('saves', 'saves', int, 0),
+    ('seconds_played', 'secondsPlayed', int, 0),
+    ('score', 'SCORE', int, 0),
+    ('wins', 'wins', int, 0),
+    ('losses', 'losses', int, 0),
+    ('redcards', 'redcards', int, 0),
+    ('user_result', 'userResult', int, 0),
+)
+
+# PlayerStats attributes written per player by the JSON exports
+_EXPORT_PLAYER_FIELDS = (
+    'player_id', 'player_name', 'position', 'rating', 'goals', 'assists', 'shots',
+    'passes', 'pass_attempts', 'tackles', 'tackle_attempts', 'saves',
+    'seconds_played', 'score', 'redcards',
+)
+_export_player = operator.attrgetter(*_EXPORT_PLAYER_FIELDS)
+
+def _iter_first_column(path: str) -> Iterator[str]:
+    """
+    Yield the first field of every data row of a CSV by scanning a memory map of it.
+    Only valid when that field is never quoted, e.g. numeric IDs.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            pos = mm.find(b'\n') + 1  # skip the header
+            while 0 < pos < end:
+                newline = mm.find(b'\n', pos)
+                if newline == -1:
+                    newline = end
+                comma = mm.find(b',', pos, newline)
+                field = mm[pos:newline if comma == -1 else comma].rstrip(b'\r')
+                if field:
+                    yield sys.intern(field.decode())
+                pos = newline + 1
+
+@dataclass(slots=True)
 class PlayerStats:
     """Structured data for a player's match statistics"""
     player_id: str
@@ -31,7 +106,7 @@ class PlayerStats:
     user_result: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchData:
     """Structured data for a complete match"""
     match_id: str
@@ -43,7 +118,7 @@ class MatchData:
         """Get all players for a specific club in this match"""
         return self.players_by_club.get(club_id, [])
     
-@dataclass
+@dataclass(slots=True)
 class MostRecentMatch:
     """Data class for storing the most recent match and its players"""
     match_id: str
@@ -65,6 +140,19 @@ class MatchPlayerParser:
         self.matches: List[MatchData] = []
         self.most_recent_match: Optional[MostRecentMatch] = None
         self.new_matches_detected = False
+        # Match IDs already parsed by this parser, used to skip unchanged polls
+        self._seen_match_ids: Set[str] = set()
+        # Match IDs found by the last check_for_new_matches call
+        self.new_match_ids: Set[str] = set()
+        # Match IDs present in most_recent_matches.csv, loaded lazily, and the
+        # file's (mtime_ns, size) when they were last in sync with it
+        self._recorded_match_ids: Optional[Set[str]] = None
+        self._recorded_fingerprint: Optional[Tuple[int, int]] = None
+        # Append-only state for most_recent_matches.csv, opened lazily and kept across polls
+        self._seen_keys: Optional[Set[Tuple[str, str]]] = None
+        self._most_recent_handle: Optional[IO[str]] = None
+        self._most_recent_writer: Optional[Any] = None
+        self._most_recent_positions: Optional[List[Optional[int]]] = None
 
     # Not needed, keeping just incase
     #def parse_csv(self) -> List[MatchData]:
@@ -81,18 +169,34 @@ class MatchPlayerParser:
         
     #    return self.matches
 
-    def _parse_match_row(self, row) -> MatchData:
-        """Parse a single CSV row into a MatchData object"""
-        match_id = str(row['matchId'])
-        timestamp = str(row['timestamp'])
-        time_ago = str(row['timeAgo'])
+    def _parse_match_row(self, match_id, timestamp, time_ago, players) -> MatchData:
+        """
+        Parse the matchId, timestamp, timeAgo and players values of a row into a MatchData object.
+        players may be the API dict itself or its string form read back from CSV.
+        """
+        # Interned: match IDs are compared and hashed across several sets
+        match_id = sys.intern(str(match_id))
+        timestamp = str(timestamp)
+        # timeAgo is a dict in API frames and its JSON text in CSVs from export_dataframe;
+        # encode the dict the same way so both paths produce identical MatchData
+        if isinstance(time_ago, (dict, list)):
+            time_ago = orjson.dumps(time_ago).decode()
+        else:
+            time_ago = str(time_ago)
         
-        # Parse the players column (it's a Python dict string, not JSON)
-        players_str = str(row['players'])
-        try:
-            players_data = ast.literal_eval(players_str)
-        except (ValueError, SyntaxError) as e:
-            raise ValueError(f"Could not parse players data: {e}")
+        if isinstance(players, dict):
+            players_data = players
+        else:
+            # Parse the players column (JSON written by FC26_API.export_dataframe;
+            # older exports stored a Python dict string, so fall back to that)
+            players_str = str(players)
+            try:
+                players_data = orjson.loads(players_str)
+            except orjson.JSONDecodeError:
+                try:
+                    players_data = ast.literal_eval(players_str)
+                except (ValueError, SyntaxError) as e:
+                    raise ValueError(f"Could not parse players data: {e}")
         
         # Build players by club dictionary
         players_by_club = {}
@@ -103,25 +207,8 @@ class MatchPlayerParser:
             for player_id, player_stats in club_players.items():
                 player = PlayerStats(
                     player_id=player_id,
-                    player_name=player_stats.get('playername', 'Unknown'),
                     club_id=club_id,
-                    position=player_stats.get('pos', 'Unknown'),
-                    archetype_id=player_stats.get('archetypeid', '0'),
-                    rating=float(player_stats.get('rating', 0)),
-                    goals=int(player_stats.get('goals', 0)),
-                    assists=int(player_stats.get('assists', 0)),
-                    shots=int(player_stats.get('shots', 0)),
-                    passes=int(player_stats.get('passesmade', 0)),
-                    pass_attempts=int(player_stats.get('passattempts', 0)),
-                    tackles=int(player_stats.get('tacklesmade', 0)),
-                    tackle_attempts=int(player_stats.get('tackleattempts', 0)),
-                    saves=int(player_stats.get('saves', 0)),
-                    seconds_played=int(player_stats.get('secondsPlayed', 0)),
-                    score=int(player_stats.get('SCORE', 0)),
-                    wins=int(player_stats.get('wins', 0)),
-                    losses=int(player_stats.get('losses', 0)),
-                    redcards=int(player_stats.get('redcards', 0)),
-                    user_result=int(player_stats.get('userResult', 0)),
+                    **{attr: cast(player_stats.get(key, default)) for attr, key, cast, default in _PLAYER_SCHEMA},
                 )
                 players_by_club[club_id].append(player)
         
@@ -140,87 +227,182 @@ class MatchPlayerParser:
         except FileNotFoundError:
             return None
         
+    @staticmethod
+    def _load_match_ids(path: str) -> Set[str]:
+        """
+        Collect the matchId column of a CSV without loading the file. When matchId is
+        the first column (as written by update_most_recent_matches) the file is scanned
+        as raw bytes; otherwise it is streamed row by row through csv.reader.
+        """
+        # utf-8-sig drops the BOM Excel adds when saving as "CSV UTF-8"
+        with open(path, newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return set()
+            if 'matchId' not in header:
+                raise FC26APIError(f"Column 'matchId' not found in {path}.")
+            if header[0] != 'matchId':
+                idx = header.index('matchId')
+                return {sys.intern(row[idx]) for row in reader if len(row) > idx}
+        return set(_iter_first_column(path))
+
+    def _most_recent_fingerprint(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of most_recent_matches.csv, or None if it does not exist"""
+        try:
+            stat = os.stat(self.most_recent_filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_recorded_match_ids(self) -> Set[str]:
+        """
+        Match IDs already in most_recent_matches.csv. Read from disk once, then kept
+        in sync by update_most_recent_matches. Raises FileNotFoundError if the file is missing.
+        """
+        if self._recorded_match_ids is None:
+            self._recorded_fingerprint = self._most_recent_fingerprint()
+            self._recorded_match_ids = self._load_match_ids(self.most_recent_filepath)
+        return self._recorded_match_ids
+
+    def _mark_all_matches_new(self) -> bool:
+        """Flag every parsed match as new because most_recent_matches.csv does not exist"""
+        print("✓ No existing most_recent_matches.csv found. All current matches are new.")
+        # Drop state tied to a file that has gone away, so the next update recreates it
+        self.close()
+        self.new_match_ids = {m.match_id for m in self.matches}
+        self.new_matches_detected = True
+        return True
+
+    def reset_detection(self) -> None:
+        """
+        Forget the result of the last check_for_new_matches call and all state read
+        from most_recent_matches.csv (recorded IDs, append handle, seen keys), keeping
+        parsed matches, so the same parser can check again, e.g. after the file was
+        swapped, instead of a new parser reparsing the CSV.
+        """
+        self.close()
+        self.new_matches_detected = False
+        self.new_match_ids = set()
+
     def check_for_new_matches(self) -> bool:
         """
         Compare club_matches with most_recent_matches to detect new matches.
-        Returns True if new matches are found.
+        Returns True if new matches are found; their IDs are kept in new_match_ids.
+
+        A missing most_recent_matches.csv is checked first and always means "new",
+        so callers that only need freshness can call this before parsing any matches.
+        Recorded IDs are reread only if the file changed since this parser last saw it.
         """
+        fingerprint = self._most_recent_fingerprint()
+        if fingerprint is None:
+            return self._mark_all_matches_new()
         if not self.matches:
             return False
+        if self._recorded_fingerprint is not None and fingerprint != self._recorded_fingerprint:
+            # Modified by something other than this parser: reload everything from disk
+            self.close()
         
-        # Load existing most recent matches
-        most_recent_df = self.load_most_recent_matches()
-        
-        if most_recent_df is None:
-            print("✓ No existing most_recent_matches.csv found. All current matches are new.")
-            self.new_matches_detected = True
-            return True
-        
-        # Get match IDs from both dataframes
-        existing_match_ids = set(most_recent_df['matchId'].astype(str))
-        current_match_ids = set([m.match_id for m in self.matches])
+        current_match_ids = {m.match_id for m in self.matches}
+        try:
+            recorded_match_ids = self._load_recorded_match_ids()
+        except FileNotFoundError:
+            return self._mark_all_matches_new()
         
         # Find new matches
-        new_match_ids = current_match_ids - existing_match_ids
+        self.new_match_ids = current_match_ids - recorded_match_ids
+        self.new_matches_detected = bool(self.new_match_ids)
         
-        if new_match_ids:
-            print(f"✓ Detected {len(new_match_ids)} new match(es)")
-            self.new_matches_detected = True
-            return True
+        if self.new_matches_detected:
+            print(f"✓ Detected {len(self.new_match_ids)} new match(es)")
         else:
             print("✓ No new matches detected")
-            self.new_matches_detected = False
-            return False
+        return self.new_matches_detected
         
     def update_most_recent_matches(self) -> None:
-        """Update most_recent_matches.csv with new matches"""
+        """Append new (matchId, player_id) rows to most_recent_matches.csv"""
         if not self.matches:
             print("No matches to save")
             return
         
-        # Convert current matches to dataframe format
-        current_matches_data = []
+        # Flatten current matches into one row per player, in _MOST_RECENT_COLUMNS order
+        writer = self._open_most_recent_writer()
+        new_rows = []
         for match in self.matches:
-            for club_id, players in match.players_by_club.items():
+            for players in match.players_by_club.values():
                 for player in players:
-                    current_matches_data.append({
-                        'matchId': match.match_id,
-                        'timestamp': match.timestamp,
-                        'timeAgo': match.time_ago,
-                        'club_id': player.club_id,
-                        'player_id': player.player_id,
-                        'player_name': player.player_name,
-                        'position': player.position,
-                        'rating': player.rating,
-                        'goals': player.goals,
-                        'assists': player.assists,
-                        'shots': player.shots,
-                        'passes': player.passes,
-                        'pass_attempts': player.pass_attempts,
-                        'tackles': player.tackles,
-                        'tackle_attempts': player.tackle_attempts,
-                        'saves': player.saves,
-                        'seconds_played': player.seconds_played,
-                        'score': player.score,
-                        'redcards': player.redcards,
-                    })
-        
-        # Load existing most recent matches
-        most_recent_df = self.load_most_recent_matches()
-        
-        if most_recent_df is not None:
-            # Append new matches
-            current_df = pd.DataFrame(current_matches_data)
-            updated_df = pd.concat([most_recent_df, current_df], ignore_index=True)
-            # Remove duplicates based on matchId and player_id
-            updated_df = updated_df.drop_duplicates(subset=['matchId', 'player_id'], keep='last')
-            updated_df.to_csv(self.most_recent_filepath, index=False)
-            print(f"✓ Updated most_recent_matches.csv with new matches")
+                    key = (match.match_id, player.player_id)
+                    if key in self._seen_keys:
+                        continue
+                    self._seen_keys.add(key)
+                    new_rows.append((match.match_id, match.timestamp, match.time_ago, *_player_row(player)))
+
+        if new_rows:
+            if self._recorded_match_ids is not None:
+                self._recorded_match_ids.update(row[0] for row in new_rows)
+            if self._most_recent_positions is not None:
+                positions = self._most_recent_positions
+                new_rows = [tuple(row[i] if i is not None else '' for i in positions) for row in new_rows]
+            writer.writerows(new_rows)
+            self._most_recent_handle.flush()
+            if self._recorded_match_ids is not None:
+                self._recorded_fingerprint = self._most_recent_fingerprint()
+            print(f"✓ Appended {len(new_rows)} new player row(s) to {self.most_recent_filepath}")
         else:
-            # Create new most_recent_matches.csv
-            df = pd.DataFrame(current_matches_data)
-            df.to_csv(self.most_recent_filepath, index=False)
-            print(f"✓ Created most_recent_matches.csv with {len(self.matches)} matches")
+            print(f"✓ {self.most_recent_filepath} already up to date")
+
+    def _open_most_recent_writer(self) -> Any:
+        """
+        Open most_recent_matches.csv for appending, loading the (matchId, player_id)
+        keys it already contains. The handle stays open until close() is called.
+        """
+        if self._most_recent_writer is not None:
+            return self._most_recent_writer
+
+        header = None
+        self._seen_keys = set()
+        try:
+            # utf-8-sig so a BOM (e.g. from Excel) does not hide the first column name
+            with open(self.most_recent_filepath, newline='', encoding='utf-8-sig') as f:
+                header = next(csv.reader(f), None)
+            if header:
+                missing = [name for name in ('matchId', 'player_id') if name not in header]
+                if missing:
+                    raise FC26APIError(
+                        f"Refusing to append to {self.most_recent_filepath}: "
+                        f"missing column(s) {', '.join(missing)}."
+                    )
+                existing = pd.read_csv(
+                    self.most_recent_filepath,
+                    usecols=['matchId', 'player_id'],
+                    dtype=str,
+                )
+                self._seen_keys = set(zip(existing['matchId'], existing['player_id']))
+        except FileNotFoundError:
+            pass
+
+        # Files written by older versions may order or name columns differently
+        self._most_recent_positions = None
+        if header and tuple(header) != _MOST_RECENT_COLUMNS:
+            index = {name: i for i, name in enumerate(_MOST_RECENT_COLUMNS)}
+            self._most_recent_positions = [index.get(name) for name in header]
+
+        self._most_recent_handle = open(self.most_recent_filepath, 'a', newline='', encoding='utf-8')
+        self._most_recent_writer = csv.writer(self._most_recent_handle)
+        if not header:
+            self._most_recent_writer.writerow(_MOST_RECENT_COLUMNS)
+            print(f"✓ Created {self.most_recent_filepath}")
+        return self._most_recent_writer
+
+    def close(self) -> None:
+        """Close the most_recent_matches.csv handle opened by update_most_recent_matches"""
+        if self._most_recent_handle is not None:
+            self._most_recent_handle.close()
+        self._most_recent_handle = None
+        self._most_recent_writer = None
+        self._seen_keys = None
+        self._recorded_match_ids = None
+        self._recorded_fingerprint = None
     
     def get_most_recent_match(self) -> Optional[MostRecentMatch]:
         """
@@ -247,6 +429,18 @@ class MatchPlayerParser:
         
         return self.most_recent_match
     
+    def _match_to_dict(self, match: MatchData) -> dict:
+        """Build the JSON export structure for a single match"""
+        return {
+            'match_id': match.match_id,
+            'timestamp': match.timestamp,
+            'time_ago': match.time_ago,
+            'clubs': {
+                club_id: [dict(zip(_EXPORT_PLAYER_FIELDS, _export_player(p))) for p in players]
+                for club_id, players in match.players_by_club.items()
+            },
+        }
+
     def export_most_recent_match_to_json(self, output_filepath: str) -> None:
         """Export only the most recent match to a JSON file"""
         if not self.matches:
@@ -256,90 +450,114 @@ class MatchPlayerParser:
         # Get the most recent match (first in the list)
         most_recent = self.matches[0]
         
-        match_data = {
-            'match_id': most_recent.match_id,
-            'timestamp': most_recent.timestamp,
-            'time_ago': most_recent.time_ago,
-            'clubs': {}
-        }
-        
-        for club_id, players in most_recent.players_by_club.items():
-            match_data['clubs'][club_id] = [
-                {
-                    'player_id': p.player_id,
-                    'player_name': p.player_name,
-                    'position': p.position,
-                    'rating': p.rating,
-                    'goals': p.goals,
-                    'assists': p.assists,
-                    'shots': p.shots,
-                    'passes': p.passes,
-                    'pass_attempts': p.pass_attempts,
-                    'tackles': p.tackles,
-                    'tackle_attempts': p.tackle_attempts,
-                    'saves': p.saves,
-                    'seconds_played': p.seconds_played,
-                    'score': p.score,
-                    'redcards': p.redcards,
-                }
-                for p in players
-            ]
-        
         # Wrap in a list to match the format of matches_readable.json
-        data = [match_data]
+        data = [self._match_to_dict(most_recent)]
         
-        with open(output_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Exported most recent match (ID: {most_recent.match_id}) to {output_filepath}")
     
     def export_matches_to_json(self, output_filepath: str) -> None:
         """Export all parsed matches to a JSON file"""
-        data = []
-        for match in self.matches:
-            match_data = {
-                'match_id': match.match_id,
-                'timestamp': match.timestamp,
-                'time_ago': match.time_ago,
-                'clubs': {}
-            }
-            
-            for club_id, players in match.players_by_club.items():
-                match_data['clubs'][club_id] = [
-                    {
-                        'player_id': p.player_id,
-                        'player_name': p.player_name,
-                        'position': p.position,
-                        'rating': p.rating,
-                        'goals': p.goals,
-                        'assists': p.assists,
-                        'shots': p.shots,
-                        'passes': p.passes,
-                        'pass_attempts': p.pass_attempts,
-                        'tackles': p.tackles,
-                        'tackle_attempts': p.tackle_attempts,
-                        'saves': p.saves,
-                        'seconds_played': p.seconds_played,
-                        'score': p.score,
-                        'redcards': p.redcards,
-                    }
-                    for p in players
-                ]
-            data.append(match_data)
+        data = [self._match_to_dict(match) for match in self.matches]
         
-        with open(output_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Exported {len(self.matches)} matches to {output_filepath}")
  
+    def _read_csv_cached(self) -> pd.DataFrame:
+        """
+        Read csv_filepath, reusing a pickled copy next to it (<csv>.pkl). The pickle
+        stores the CSV's (mtime_ns, size) and is used only when both still match
+        exactly; otherwise the CSV is parsed and the pickle rewritten.
+        """
+        cache_path = self.csv_filepath + '.pkl'
+        stat = os.stat(self.csv_filepath)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        try:
+            cached_fingerprint, cached_df = pd.read_pickle(cache_path)
+            if cached_fingerprint == fingerprint:
+                return cached_df
+        except Exception:
+            # Missing, old-format or unreadable cache: fall back to the CSV
+            pass
+
+        df = pd.read_csv(
+            self.csv_filepath,
+            usecols=list(_MATCH_CSV_COLUMNS),
+            dtype={'matchId': str, 'timestamp': str, 'timeAgo': str, 'players': str},
+            engine='c',
+        )
+        try:
+            pd.to_pickle((fingerprint, df), cache_path)
+        except OSError as e:
+            print(f"Warning: could not cache {self.csv_filepath}: {e}")
+        return df
+
     def parse_csv(self) -> List[MatchData]:
-        """Parse the CSV file and extract match data"""
-        df = pd.read_csv(self.csv_filepath)
+        """
+        Parse the CSV file and extract match data. Parsed matches are shared
+        process-wide until the file's mtime or size changes.
+        """
+        path = os.path.abspath(self.csv_filepath)
+        stat = os.stat(path)
+        self.matches = list(_load_matches_cached(path, stat.st_mtime_ns, stat.st_size))
+        self._seen_match_ids.update(m.match_id for m in self.matches)
+        return self.matches
+
+    def iter_matches(self, chunksize: int = 256) -> Iterator[MatchData]:
+        """
+        Lazily yield matches from the CSV file, reading it in chunks of rows.
+        Unlike parse_csv this neither stores the matches nor caches them.
+        """
+        chunks = pd.read_csv(
+            self.csv_filepath,
+            usecols=list(_MATCH_CSV_COLUMNS),
+            dtype={'matchId': str, 'timestamp': str, 'timeAgo': str, 'players': str},
+            engine='c',
+            chunksize=chunksize,
+        )
+        with chunks:
+            idx = 0
+            for chunk in chunks:
+                for row in chunk[list(_MATCH_CSV_COLUMNS)].itertuples(index=False, name=None):
+                    try:
+                        yield self._parse_match_row(*row)
+                    except Exception as e:
+                        print(f"Error parsing row {idx}: {e}")
+                    idx += 1
+
+    def count_rows(self) -> int:
+        """Count the data rows of the CSV file from its newlines, without parsing it"""
+        newlines = 0
+        last = b'\n'
+        with open(self.csv_filepath, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                newlines += block.count(b'\n')
+                last = block[-1:]
+        if last != b'\n':
+            newlines += 1  # final line without a trailing newline
+        return max(newlines - 1, 0)
+
+    def unseen_matches(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the rows of df whose matchId this parser has not parsed yet"""
+        return df[~df['matchId'].astype(str).isin(self._seen_match_ids)]
+
+    def parse_dataframe(self, df: pd.DataFrame) -> List[MatchData]:
+        """
+        Parse matches from a DataFrame, e.g. straight from FC26_API.get_club_matches_normalized.
+        Replaces any previously parsed matches.
+        """
+        self.matches = []
+        rows = df[list(_MATCH_CSV_COLUMNS)].itertuples(index=False, name=None)
         
-        for idx, row in df.iterrows():
+        for idx, row in enumerate(rows):
             try:
-                match = self._parse_match_row(row)
+                match = self._parse_match_row(*row)
                 self.matches.append(match)
+                self._seen_match_ids.add(match.match_id)
             except Exception as e:
                 print(f"Error parsing row {idx}: {e}")
                 continue
@@ -359,14 +577,73 @@ class MatchPlayerParser:
 
         return
     
+@functools.lru_cache(maxsize=8)
+def _load_matches_cached(path: str, mtime_ns: int, size: int) -> Tuple[MatchData, ...]:
+    """
+    Parse a match CSV once per (path, mtime_ns, size) for the whole process.
+    Returns a tuple so callers cannot modify the cached sequence.
+    """
+    if size > _PARALLEL_PARSE_THRESHOLD:
+        return tuple(_parallel_parse(path))
+    parser = MatchPlayerParser(path)
+    return tuple(parser.parse_dataframe(parser._read_csv_cached()))
+
+
+def _parse_byte_range(path: str, start: int, end: int, names: List[str]) -> List[MatchData]:
+    """Parse the CSV lines of path that start within [start, end) into MatchData"""
+    lines = []
+    with open(path, 'rb') as f:
+        # Step back one byte so a line beginning exactly at start is kept
+        f.seek(start - 1)
+        f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+    if not lines:
+        return []
+
+    df = pd.read_csv(
+        io.BytesIO(b''.join(lines)),
+        header=None,
+        names=names,
+        usecols=list(_MATCH_CSV_COLUMNS),
+        dtype=str,
+        engine='c',
+    )
+    return MatchPlayerParser(path).parse_dataframe(df)
+
+
+def _parallel_parse(path: str, n_workers: Optional[int] = None) -> List[MatchData]:
+    """
+    Parse a large match CSV in worker processes, one newline-aligned byte range each.
+    Assumes no quoted field spans lines, which holds for files written by export_dataframe.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+    names = next(csv.reader([header_line.decode('utf-8')]))
+
+    body_start = len(header_line)
+    step = -(-(size - body_start) // n_workers)
+    starts = [body_start + i * step for i in range(n_workers)]
+    ends = [min(start + step, size) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        parts = executor.map(_parse_byte_range, [path] * n_workers, starts, ends, [names] * n_workers)
+        return [match for part in parts for match in part]
+
+
 class PlayerStatsParser:
     def __init__(self):
         self.json_file = "newest_match.json"
 
     def parse_stats(self):
         # Load the JSON file
-        with open(self.json_file, 'r') as f:
-            data = json.load(f)
+        with open(self.json_file, 'rb') as f:
+            data = orjson.loads(f.read())
 
         # Get the club data
         club_id = "3439844"
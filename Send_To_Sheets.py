@@ -1,22 +1,38 @@
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Sequence, Union
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session shared by all payload senders."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=8))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 class GoogleSheetsPayload:
     """Send player stat payloads to Google Apps Script."""
+
+    # Shared across instances so repeated sends reuse the same TLS connection
+    _session = _build_session()
     
-    def __init__(self, payload: str):
+    def __init__(self, payload: Union[str, Sequence[str]], session: Optional[requests.Session] = None):
         """
         Initialize with a payload to send to Google Apps Script.
         
         Args:
-            payload: String formatted as "playerName statName statValue"
+            payload: String formatted as "playerName statName statValue", or a sequence
+                     of such strings sent together as one newline-separated POST body
             script_url: The deployment URL of your Google Apps Script doPost endpoint.
                        Can also be set via the script_url property.
+            session: Optional requests.Session to send with; defaults to one shared by all instances.
         """
         GOOGLE_SCRIPT_URL = "https://script.google.com/macros/s/AKfycbzdH8_UPQpcQ2Wc2fT6FR7uXAoY2GibvgywnhBllG6RtVB_JZby20GItK9lBOnRi3qh/exec"
 
-        self.payload = payload
+        self.payload = payload if isinstance(payload, str) else "\n".join(payload)
         self.script_url = GOOGLE_SCRIPT_URL
+        self.session = session or GoogleSheetsPayload._session
     
     def send(self) -> requests.Response:
         """
@@ -33,7 +49,7 @@ class GoogleSheetsPayload:
             raise ValueError("script_url must be set before sending")
         
         headers = {'Content-Type': 'text/plain;charset=utf-8'}
-        response = requests.post(self.script_url, data=self.payload, headers=headers)
+        response = self.session.post(self.script_url, data=self.payload, headers=headers)
         response.raise_for_status()
         return response
     
@@ -48,10 +64,33 @@ class GoogleSheetsPayload:
             Response object from the POST request
         """
         headers = {'Content-Type': 'text/plain;charset=utf-8'}
-        response = requests.post(script_url, data=self.payload, headers=headers)
+        response = self.session.post(script_url, data=self.payload, headers=headers)
         response.raise_for_status()
         return response
 
+    @classmethod
+    def send_all(cls, payloads: Sequence[str], max_concurrency: int = 8) -> List[requests.Response]:
+        """
+        Send each payload as its own POST, concurrently.
+
+        For Apps Script deployments that only accept one record per request.
+        At most max_concurrency requests are in flight, all over the shared session.
+        
+        Args:
+            payloads: Strings formatted as "playerName statName statValue"
+            max_concurrency: Upper bound on simultaneous requests
+            
+        Returns:
+            Response objects in the same order as payloads
+            
+        Raises:
+            requests.exceptions.RequestException: If any request fails
+        """
+        if not payloads:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(payloads))) as executor:
+            return list(executor.map(lambda payload: cls(payload).send(), payloads))
+
 if __name__ == "__main__":
     # Example payload
     sender = GoogleSheetsPayload("SnakePro676 Redcards 15")
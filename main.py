@@ -3,15 +3,20 @@ from Send_To_Sheets import GoogleSheetsPayload
 from Match_Parser import PlayerStatsParser, MatchPlayerParser
 import pandas as pd
 import time
+
+# Write club_matches.csv once every N polls; parsing works on the in-memory DataFrame
+CSV_CHECKPOINT_EVERY = 10
  
 # Every 2 mins check for new matches, if there is a new match, send the stats to google sheets
 def main():
+    match_parser = None
     try:
         print("Starting Pro Clubs Stats Tracker...")
         api = FC26_API()
         parser = PlayerStatsParser()#"newest_match.json"
         match_parser = MatchPlayerParser("club_matches.csv")
         print("Initialization complete. Entering main loop...")
+        polls = 0
 
         while True:
             print("\nChecking for new matches...")
@@ -20,36 +25,51 @@ def main():
             # Fetch matches from API
             matches_df = api.get_club_matches_normalized(club_id, match_type="leagueMatch")
             
-            # Save the fetched matches to CSV
-            if matches_df is not None and not matches_df.empty:
+            if matches_df is None or matches_df.empty:
+                print("✗ No matches returned from API")
+                time.sleep(60)
+                continue
+
+            # Checkpoint the fetched matches to CSV every few polls (first poll included)
+            if polls % CSV_CHECKPOINT_EVERY == 0:
                 api.export_dataframe(matches_df, "club_matches.csv", file_format="csv")
                 print("✓ Updated club_matches.csv with latest API data")
-            else:
-                print("✗ No matches returned from API")
-            
+            polls += 1
         
-            # Parse the CSV file to populate match_parser.matches
-            match_parser.parse_csv()
+            # Only parse matches that earlier polls have not already handled
+            new_matches_df = match_parser.unseen_matches(matches_df)
+            if new_matches_df.empty:
+                print("✓ No new matches since last check")
+                time.sleep(60)
+                continue
+
+            # Parse the fetched DataFrame directly to populate match_parser.matches
+            match_parser.parse_dataframe(new_matches_df)
             
-            # Check if there are new matches
-            if match_parser.check_for_new_matches():
+            # Check if there are new matches (nothing to check if every row failed to parse;
+            # check_for_new_matches reports True for a missing most_recent_matches.csv regardless)
+            if match_parser.matches and match_parser.check_for_new_matches():
                 print("New match found! Parsing stats...")
                 
                 # Update and export FIRST so parse_stats() reads fresh data
                 match_parser.update_most_recent_matches()
                 match_parser.export_most_recent_match_to_json("newest_match.json")
                 
+                # Send every stat line in a single POST; the Apps Script splits on newlines
                 payloads = parser.parse_stats()
-                for payload in payloads:
-                    sender = GoogleSheetsPayload(payload)
+                if payloads:
+                    sender = GoogleSheetsPayload(payloads)
                     response = sender.send()
-                    print(f"Sent payload: {payload} | Response: {response.text}")
+                    print(f"Sent {len(payloads)} payload(s) | Response: {response.text}")
             
             time.sleep(60)  # Sleep for 60 seconds before checking again
     except KeyboardInterrupt:
         print("=" * 60)
         print("Exciting...")
         print("=" * 60)
+    finally:
+        if match_parser is not None:
+            match_parser.close()
 
 
 if __name__ == "__main__":